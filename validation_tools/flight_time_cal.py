@@ -1,4 +1,52 @@
-import math
+import numpy as np
+
+def compute(wind_dir, wind_speed, mag_course, distance_nm, tas, magvar):
+    """
+    Wind correction angle, ground speed and flight time for one or many legs
+
+    All arguments may be scalars or NumPy arrays (broadcast together), so a
+    whole sweep of wind conditions is evaluated in one call.
+
+    Args:
+        wind_dir: Wind direction (degrees)
+        wind_speed: Wind speed (knots)
+        mag_course: Magnetic course (degrees)
+        distance_nm: Distance (nautical miles)
+        tas: True air speed (knots)
+        magvar: Magnetic variation (degrees)
+
+    Returns:
+        tuple: (wca_deg, ground_speed, flight_time) as arrays; flight_time is in
+        whole minutes (rounded up) and NaN where the wind is too strong for the
+        TAS or the ground speed is not positive
+    """
+    wind_dir = np.asarray(wind_dir, dtype=np.float64)
+    wind_speed = np.asarray(wind_speed, dtype=np.float64)
+    distance_nm = np.asarray(distance_nm, dtype=np.float64)
+    tas = np.asarray(tas, dtype=np.float64)
+    magvar = np.asarray(magvar, dtype=np.float64)
+
+    # Convert magnetic course to true course
+    true_course = np.asarray(mag_course, dtype=np.float64) - magvar
+
+    # Wind angle relative to the course (radians)
+    wind_angle = np.radians(wind_dir - true_course)
+
+    # Wind Correction Angle; NaN when wind speed is too high relative to TAS
+    with np.errstate(divide='ignore', invalid='ignore'):
+        wca_rad = np.arcsin((wind_speed / tas) * np.sin(wind_angle))
+
+    # Ground speed. Equal to the spreadsheet form
+    # wind_speed * sin(wind_angle - wca) / sin(wca), but stays finite for
+    # direct head/tail winds where wca is 0.
+    ground_speed = tas * np.cos(wca_rad) - wind_speed * np.cos(wind_angle)
+
+    # Flight time in minutes (rounded up)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        flight_time = np.where(ground_speed > 0,
+                               np.ceil(distance_nm / ground_speed * 60), np.nan)
+
+    return np.degrees(wca_rad), ground_speed, flight_time
 
 def calculate_flight_time():
     # Constants
@@ -21,38 +69,19 @@ def calculate_flight_time():
     # Convert magnetic course to true course
     true_course = mag_course - magnetic_variation
 
-    # Convert degrees to radians
-    wind_dir_rad = math.radians(wind_dir)
-    true_course_rad = math.radians(true_course)
+    wca_deg, ground_speed, flight_time = compute(wind_dir, wind_speed, mag_course, distance_nm,
+                                                 true_air_speed, magnetic_variation)
 
     # Wind Correction Angle (in degrees)
-    try:
-        wca_rad = math.asin((wind_speed / true_air_speed) * math.sin(wind_dir_rad - true_course_rad))
-        print(round(math.asin((wind_speed / true_air_speed)), 9))
-        print(round(math.sin(wind_dir_rad - true_course_rad), 9))
-        print(round(math.degrees(wca_rad), 9))
-
-    except ValueError:
+    if np.isnan(wca_deg):
         print("Invalid input: wind speed too high relative to TAS.")
         return
 
-    wca_deg = math.degrees(wca_rad)
-
-    # Ground speed calculation
-    if round(math.degrees(true_course_rad), 1) == round(wind_dir, 1):
-        ground_speed = true_air_speed - wind_speed
-    else:
-        try:
-            ground_speed = (wind_speed * math.sin(wind_dir_rad - true_course_rad - wca_rad)) / math.sin(wca_rad)
-        except ZeroDivisionError:
-            print("Ground speed calculation failed due to angle conditions.")
-            return
-
-    # Flight time in minutes (rounded up)
-    if ground_speed <= 0:
+    # Flight time in minutes (rounded up); NaN when ground speed is not positive
+    if np.isnan(flight_time):
         print("Error: Ground speed too low or negative.")
         return
-    flight_time = math.ceil((distance_nm / ground_speed) * 60)
+    flight_time = int(flight_time)
 
     # Output
     print(f"\n✅ Results:")
@@ -64,5 +93,5 @@ def calculate_flight_time():
     # print(f"Ground Speed: {ground_speed:.2f} knots")
     print(f"Estimated Flight Time: {flight_time} minutes")
 
-# Run the calculator
-calculate_flight_time()
+if __name__ == "__main__":
+    calculate_flight_time()
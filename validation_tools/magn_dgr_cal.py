@@ -4,28 +4,259 @@ Magnetic Course Degree Calculator
 Calculates the magnetic course degree between two coordinates for helicopter navigation.
 
 Usage: python magn_dgr_cal.py
+Requires: numpy (pip install numpy); numba and cupy are optional accelerators
+          for the scalar kernels and the GPU batch path
 Input format: hh.hhhh (e.g., 23.9739 for latitude, 120.9820 for longitude)
 Magnetic variation: -4.1 degrees (regional setting)
 """
 
 import math
+import types
+from typing import Any, Callable, Final, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+try:
+    from numba import njit as _numba_njit
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba is optional; fall back to plain Python kernels
+    _HAS_NUMBA = False
+
+
+def njit(**kwargs: Any) -> Callable[[Any], Any]:
+    """Numba njit when available, otherwise leave the function as-is"""
+    def decorate(func: Any) -> Any:
+        # mypyc/Cython builds hand us native functions Numba cannot JIT
+        if not _HAS_NUMBA or not isinstance(func, types.FunctionType):
+            return func
+        return _numba_njit(**kwargs)(func)
+    return decorate
+
+try:
+    import cupy as cp  # type: ignore[import-not-found]
+    _HAS_CUPY = True
+except ImportError:
+    # CuPy is optional; batch courses stay on the CPU
+    _HAS_CUPY = False
+
+# Regional magnetic variation (degrees)
+_MAGNETIC_VARIATION: Final = -4.1
+
+# Earth radius in nautical miles
+_EARTH_RADIUS_NM: Final = 3443.89849
+
+# Conversion factors
+_DEG_TO_RAD: Final = math.pi / 180
+_RAD_TO_DEG: Final = 180 / math.pi
+
+# Reciprocal of a full turn, for the branchless 0-360 wrap on arrays
+_INV_360: Final = 1.0 / 360.0
+
+# Below this many legs, host/device transfers cost more than the GPU saves
+_GPU_MIN_LEGS: Final = 100_000
+
+# Octant offsets for the fast atan2 argument reduction
+_ATAN_C1: Final = math.pi / 4
+_ATAN_C2: Final = 3 * math.pi / 4
+
+# Odd polynomial for atan(r) on [-1, 1], written as
+# r * (pi/4 + (r^2 - 1) * Q(r^2)) so it is exactly +/-pi/4 at r = +/-1 and
+# cardinal bearings come out exact. Q is a minimax fit of degree 3
+# (same order as Abramowitz & Stegun 4.4.49), max error ~0.0007 deg.
+_ATAN_Q0: Final = -0.214457352
+_ATAN_Q1: Final = 0.115667844
+_ATAN_Q2: Final = -0.063720446
+_ATAN_Q3: Final = 0.020245763
+
+
+@njit(cache=True)
+def _fast_atan2(y: float, x: float) -> float:
+    """
+    Polynomial approximation of math.atan2 (radians)
+
+    Reduces the argument to r in [-1, 1] around the pi/4 (x >= 0) or
+    3pi/4 (x < 0) diagonal and evaluates a degree-9 odd polynomial that is
+    exact on the axes. Max absolute error is about 1.25e-5 rad (~0.0007 deg).
+    """
+    abs_y = abs(y)
+    if x == 0.0 and abs_y == 0.0:
+        return 0.0
+    if x >= 0:
+        r = (x - abs_y) / (x + abs_y)
+        base = _ATAN_C1
+    else:
+        r = (x + abs_y) / (abs_y - x)
+        base = _ATAN_C2
+    r2 = r * r
+    atan_r = r * (_ATAN_C1 + (r2 - 1) * (_ATAN_Q0 + r2 * (_ATAN_Q1 +
+                  r2 * (_ATAN_Q2 + r2 * _ATAN_Q3))))
+    angle = base - atan_r
+    return -angle if y < 0 else angle
+
+
+def _fast_atan2_vec(y: Any, x: Any, xp: Any = np) -> Any:
+    """
+    Vectorized version of _fast_atan2 for float arrays (radians)
+
+    Branchless: both octant reductions are evaluated and selected with
+    xp.where, so the whole computation stays in array ufuncs. xp is the
+    array module (numpy, or cupy inside the fused GPU kernel).
+    """
+    abs_y = xp.abs(y)
+    sign_flip = xp.where(y < 0, -1.0, 1.0)
+    x_ge_0 = x >= 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = xp.where(x_ge_0, (x - abs_y) / (x + abs_y), (x + abs_y) / (abs_y - x))
+    base = xp.where(x_ge_0, _ATAN_C1, _ATAN_C2)
+    r2 = r * r
+    atan_r = r * (_ATAN_C1 + (r2 - 1) * (_ATAN_Q0 + r2 * (_ATAN_Q1 +
+                  r2 * (_ATAN_Q2 + r2 * _ATAN_Q3))))
+    angle = sign_flip * (base - atan_r)
+    # atan2(0, 0) is defined as 0
+    return xp.where((x == 0) & (abs_y == 0), 0.0, angle)
+
+
+def _wrap360_vec(x: ArrayLike) -> Any:
+    """
+    Normalize degrees to 0-360 as x - 360 * floor(x / 360)
+
+    Cheaper than np.mod on float arrays, which adds Python floor-division
+    sign corrections; all three steps are plain SIMD ufuncs. float64 arrays
+    are updated in place; scalar or 0-d input returns a NumPy scalar.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    quotient = np.multiply(x, _INV_360, out=np.empty_like(x))
+    np.floor(quotient, out=quotient)
+    quotient *= 360.0
+    x -= quotient
+    return x[()]
+
+
+def _true_course_gpu(lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> Any:
+    """
+    Elementwise true course for CuPy arrays (degrees, 0-360)
+
+    Same math as calculate_true_course_vec, written only with CuPy ufuncs
+    (including _fast_atan2_vec with xp=cp) so cp.fuse can compile it into a
+    single CUDA kernel.
+    """
+    # Convert to radians
+    phi1 = lat1 * _DEG_TO_RAD
+    phi2 = lat2 * _DEG_TO_RAD
+    delta_lambda = (lon2 - lon1) * _DEG_TO_RAD
+
+    cos_phi2 = cp.cos(phi2)
+    y = cp.sin(delta_lambda) * cos_phi2
+    x = cp.cos(phi1) * cp.sin(phi2) - cp.sin(phi1) * cos_phi2 * cp.cos(delta_lambda)
+
+    # Normalize to 0-360 degrees
+    bearing_deg = _fast_atan2_vec(y, x, cp) * _RAD_TO_DEG + 360.0
+    return bearing_deg - 360.0 * cp.floor(bearing_deg * _INV_360)
+
+
+if _HAS_CUPY:
+    _true_course_fused = cp.fuse()(_true_course_gpu)
+
+
+@njit(cache=True)
+def _true_course_njit(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great circle true course in degrees (0-360), unrounded"""
+    # Convert to radians
+    phi1 = lat1 * _DEG_TO_RAD
+    phi2 = lat2 * _DEG_TO_RAD
+    delta_lambda = (lon2 - lon1) * _DEG_TO_RAD
+
+    # Calculate true course using spherical trigonometry
+    y = math.sin(delta_lambda) * math.cos(phi2)
+    x = (math.cos(phi1) * math.sin(phi2) -
+         math.sin(phi1) * math.cos(phi2) * math.cos(delta_lambda))
+
+    # Calculate bearing in radians, then convert to degrees
+    bearing_deg = _fast_atan2(y, x) * _RAD_TO_DEG
+
+    # Normalize to 0-360 degrees
+    return (bearing_deg + 360) % 360
+
+
+@njit(cache=True)
+def _haversine_nm_njit(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great circle distance in nautical miles (Haversine), unrounded"""
+    # Convert to radians
+    phi1 = lat1 * _DEG_TO_RAD
+    phi2 = lat2 * _DEG_TO_RAD
+    delta_phi = (lat2 - lat1) * _DEG_TO_RAD
+    delta_lambda = (lon2 - lon1) * _DEG_TO_RAD
+
+    # Haversine formula, using sin^2(x/2) = (1 - cos(x)) / 2
+    a = (0.5 * (1 - math.cos(delta_phi)) +
+         math.cos(phi1) * math.cos(phi2) * 0.5 * (1 - math.cos(delta_lambda)))
+
+    # Rounding can push a just outside [0, 1] for near-antipodal points
+    a = min(1.0, max(0.0, a))
+
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+
+    # Distance in nautical miles
+    return _EARTH_RADIUS_NM * c
+
+
+@njit(cache=True)
+def _course_and_distance_njit(lat1: float, lon1: float,
+                              lat2: float, lon2: float) -> Tuple[float, float]:
+    """True course (degrees, 0-360) and distance (NM) sharing one set of trig values"""
+    # Convert to radians
+    phi1 = lat1 * _DEG_TO_RAD
+    phi2 = lat2 * _DEG_TO_RAD
+    delta_lambda = (lon2 - lon1) * _DEG_TO_RAD
+
+    sp1 = math.sin(phi1)
+    cp1 = math.cos(phi1)
+    sp2 = math.sin(phi2)
+    cp2 = math.cos(phi2)
+    sdl = math.sin(delta_lambda)
+    cdl = math.cos(delta_lambda)
+
+    # True course, same formula as _true_course_njit
+    bearing_deg = _fast_atan2(sdl * cp2, cp1 * sp2 - sp1 * cp2 * cdl) * _RAD_TO_DEG
+    true_course = (bearing_deg + 360) % 360
+
+    # Distance from the spherical law of cosines on the same trig values
+    cos_c = sp1 * sp2 + cp1 * cp2 * cdl
+    cos_c = min(1.0, max(-1.0, cos_c))
+    distance = _EARTH_RADIUS_NM * math.acos(cos_c)
+
+    return true_course, distance
+
 
 class MagneticCourseCalculator:
-    def __init__(self):
-        # Regional magnetic variation (degrees)
-        self.MAGNETIC_VARIATION = -4.1
+    def __init__(self) -> None:
+        # Regional magnetic variation (degrees); may be changed per instance
+        self._magnetic_variation = _MAGNETIC_VARIATION
         
-        # Earth radius in nautical miles  
-        self.EARTH_RADIUS_NM = 3443.89849
-        
-        # Conversion factors
-        self.DEG_TO_RAD = math.pi / 180
-        self.RAD_TO_DEG = 180 / math.pi
+        # Variation rebased to 0-360 so applying it is one add and one mod
+        self._MAGVAR_OFF = (_MAGNETIC_VARIATION + 360.0) % 360.0
+    
+    @property
+    def MAGNETIC_VARIATION(self) -> float:
+        """Regional magnetic variation (degrees)"""
+        return self._magnetic_variation
     
-    def calculate_true_course(self, lat1, lon1, lat2, lon2):
+    @MAGNETIC_VARIATION.setter
+    def MAGNETIC_VARIATION(self, value: float) -> None:
+        # Keep the rebased offset in sync with the variation
+        self._magnetic_variation = value
+        self._MAGVAR_OFF = (value + 360.0) % 360.0
+    
+    def calculate_true_course(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
         Calculate true course (bearing) between two points using great circle navigation
         
+        Uses a polynomial atan2 approximation with a measured max bearing
+        error of about 0.0007 degrees, well below the 0.1 degree display
+        resolution; due N/E/S/W are exact.
+        
         Args:
             lat1 (float): Latitude of starting point (degrees)
             lon1 (float): Longitude of starting point (degrees) 
@@ -35,31 +266,10 @@ class MagneticCourseCalculator:
         Returns:
             float: True course in degrees (0-360)
         """
-        try:
-            # Convert to radians
-            phi1 = lat1 * self.DEG_TO_RAD
-            phi2 = lat2 * self.DEG_TO_RAD
-            delta_lambda = (lon2 - lon1) * self.DEG_TO_RAD
-            
-            # Calculate true course using spherical trigonometry
-            y = math.sin(delta_lambda) * math.cos(phi2)
-            x = (math.cos(phi1) * math.sin(phi2) - 
-                 math.sin(phi1) * math.cos(phi2) * math.cos(delta_lambda))
-            
-            # Calculate bearing in radians, then convert to degrees
-            bearing_rad = math.atan2(y, x)
-            bearing_deg = bearing_rad * self.RAD_TO_DEG
-            
-            # Normalize to 0-360 degrees
-            true_course = (bearing_deg + 360) % 360
-            
-            return round(true_course, 1)
-            
-        except Exception as e:
-            print(f"Error calculating true course: {e}")
-            return 0
+        return round(_true_course_njit(lat1, lon1, lat2, lon2), 1)
     
-    def calculate_magnetic_course(self, lat1, lon1, lat2, lon2):
+    def calculate_magnetic_course(self, lat1: float, lon1: float,
+                                  lat2: float, lon2: float) -> Tuple[float, float]:
         """
         Calculate magnetic course by applying magnetic variation to true course
         
@@ -75,16 +285,16 @@ class MagneticCourseCalculator:
         # Calculate true course
         true_course = self.calculate_true_course(lat1, lon1, lat2, lon2)
         
-        # Apply magnetic variation
-        # Magnetic Course = True Course + Magnetic Variation
-        magnetic_course = true_course + self.MAGNETIC_VARIATION
-        
-        # Normalize to 0-360 degrees
-        magnetic_course = (magnetic_course + 360) % 360
+        return true_course, self._magnetic_from_true(true_course)
+    
+    def _magnetic_from_true(self, true_course: float) -> float:
+        """Apply magnetic variation to a true course and round to 0.1 degree"""
+        # Magnetic Course = True Course + Magnetic Variation, normalized to 0-360 degrees
+        magnetic_course = (true_course + self._MAGVAR_OFF) % 360.0
         
-        return true_course, round(magnetic_course, 1)
+        return round(magnetic_course, 1)
     
-    def calculate_distance(self, lat1, lon1, lat2, lon2):
+    def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
         Calculate great circle distance between two points
         
@@ -97,30 +307,225 @@ class MagneticCourseCalculator:
         Returns:
             float: Distance in nautical miles
         """
-        try:
-            # Convert to radians
-            phi1 = lat1 * self.DEG_TO_RAD
-            phi2 = lat2 * self.DEG_TO_RAD
-            delta_phi = (lat2 - lat1) * self.DEG_TO_RAD
-            delta_lambda = (lon2 - lon1) * self.DEG_TO_RAD
-
-            # Haversine formula
-            a = (math.sin(delta_phi/2) * math.sin(delta_phi/2) +
-                 math.cos(phi1) * math.cos(phi2) *
-                 math.sin(delta_lambda/2) * math.sin(delta_lambda/2))
+        return round(_haversine_nm_njit(lat1, lon1, lat2, lon2), 1)
+
+    def course_and_distance(self, lat1: float, lon1: float,
+                            lat2: float, lon2: float) -> Tuple[float, float, float]:
+        """
+        Calculate true course, magnetic course and distance in one pass
+        
+        Shares sin/cos of both latitudes and the longitude difference
+        between the course and distance formulas; distance uses the
+        spherical law of cosines instead of Haversine.
+        
+        Args:
+            lat1 (float): Latitude of starting point (degrees)
+            lon1 (float): Longitude of starting point (degrees) 
+            lat2 (float): Latitude of destination point (degrees)
+            lon2 (float): Longitude of destination point (degrees)
             
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+        Returns:
+            tuple: (true_course, magnetic_course, distance) in degrees and nautical miles
+        """
+        true_course, distance = _course_and_distance_njit(lat1, lon1, lat2, lon2)
+        true_course = round(true_course, 1)
+        return true_course, self._magnetic_from_true(true_course), round(distance, 1)
 
-            # Distance in nautical miles
-            distance = self.EARTH_RADIUS_NM * c
+    def calculate_true_course_vec(self, lat1: ArrayLike, lon1: ArrayLike,
+                                  lat2: ArrayLike, lon2: ArrayLike) -> np.ndarray:
+        """
+        Calculate true courses for many legs at once (vectorized)
+        
+        Args:
+            lat1 (np.ndarray): Latitudes of starting points (degrees)
+            lon1 (np.ndarray): Longitudes of starting points (degrees)
+            lat2 (np.ndarray): Latitudes of destination points (degrees)
+            lon2 (np.ndarray): Longitudes of destination points (degrees)
             
-            return round(distance, 1)
+        Returns:
+            np.ndarray: True courses in degrees (0-360), unrounded
+        
+        Example:
+            For a route of N waypoints, all N-1 legs in one call:
+            calculator.calculate_true_course_vec(lat[:-1], lon[:-1], lat[1:], lon[1:])
+        """
+        lat1 = np.asarray(lat1, dtype=np.float64)
+        lon1 = np.asarray(lon1, dtype=np.float64)
+        lat2 = np.asarray(lat2, dtype=np.float64)
+        lon2 = np.asarray(lon2, dtype=np.float64)
+        
+        # Convert to radians
+        phi1 = np.deg2rad(lat1)
+        phi2 = np.deg2rad(lat2)
+        delta_lambda = np.deg2rad(lon2 - lon1)
+        
+        # Same spherical trigonometry as calculate_true_course
+        y = np.sin(delta_lambda) * np.cos(phi2)
+        x = (np.cos(phi1) * np.sin(phi2) -
+             np.sin(phi1) * np.cos(phi2) * np.cos(delta_lambda))
+        
+        # Normalize to 0-360 degrees
+        return _wrap360_vec(np.rad2deg(_fast_atan2_vec(y, x)) + 360.0)
+    
+    def calculate_true_course_gpu(self, lat1: Any, lon1: Any, lat2: Any, lon2: Any) -> Any:
+        """
+        Calculate true courses for a large batch of legs on the GPU (CuPy)
+        
+        Falls back to calculate_true_course_vec when CuPy is not installed or
+        a host batch has fewer than _GPU_MIN_LEGS legs. Arrays already on the
+        device always run on the GPU.
+        
+        Args:
+            lat1 (np.ndarray | cupy.ndarray): Latitudes of starting points (degrees)
+            lon1 (np.ndarray | cupy.ndarray): Longitudes of starting points (degrees)
+            lat2 (np.ndarray | cupy.ndarray): Latitudes of destination points (degrees)
+            lon2 (np.ndarray | cupy.ndarray): Longitudes of destination points (degrees)
             
-        except Exception as e:
-            print(f"Error calculating distance: {e}")
-            return 0
+        Returns:
+            np.ndarray | cupy.ndarray: True courses in degrees (0-360), unrounded;
+            CuPy inputs return a CuPy array, host inputs a NumPy array
+        """
+        on_device = _HAS_CUPY and isinstance(lat1, cp.ndarray)
+        if not on_device and (not _HAS_CUPY or np.size(lat1) < _GPU_MIN_LEGS):
+            return self.calculate_true_course_vec(lat1, lon1, lat2, lon2)
+        
+        courses = _true_course_fused(cp.asarray(lat1, dtype=cp.float64),
+                                     cp.asarray(lon1, dtype=cp.float64),
+                                     cp.asarray(lat2, dtype=cp.float64),
+                                     cp.asarray(lon2, dtype=cp.float64))
+        return courses if on_device else cp.asnumpy(courses)
+    
+    def calculate_magnetic_course_vec(self, lat1: ArrayLike, lon1: ArrayLike,
+                                      lat2: ArrayLike, lon2: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate true and magnetic courses for many legs at once (vectorized)
+        
+        Args:
+            lat1 (np.ndarray): Latitudes of starting points (degrees)
+            lon1 (np.ndarray): Longitudes of starting points (degrees)
+            lat2 (np.ndarray): Latitudes of destination points (degrees)
+            lon2 (np.ndarray): Longitudes of destination points (degrees)
+            
+        Returns:
+            tuple: (true_courses, magnetic_courses) in degrees (0-360), unrounded
+        """
+        true_courses = self.calculate_true_course_vec(lat1, lon1, lat2, lon2)
+        
+        # Apply magnetic variation; the wrap reuses this sum's buffer in place
+        magnetic_courses = _wrap360_vec(true_courses + self._MAGVAR_OFF)
+        
+        return true_courses, magnetic_courses
+    
+    def calculate_distance_vec(self, lat1: ArrayLike, lon1: ArrayLike,
+                               lat2: ArrayLike, lon2: ArrayLike) -> np.ndarray:
+        """
+        Calculate great circle distances for many legs at once (vectorized)
+        
+        Args:
+            lat1 (np.ndarray): Latitudes of starting points (degrees)
+            lon1 (np.ndarray): Longitudes of starting points (degrees)
+            lat2 (np.ndarray): Latitudes of destination points (degrees)
+            lon2 (np.ndarray): Longitudes of destination points (degrees)
+            
+        Returns:
+            np.ndarray: Distances in nautical miles, unrounded
+        """
+        lat1 = np.asarray(lat1, dtype=np.float64)
+        lon1 = np.asarray(lon1, dtype=np.float64)
+        lat2 = np.asarray(lat2, dtype=np.float64)
+        lon2 = np.asarray(lon2, dtype=np.float64)
+        
+        # Convert to radians
+        phi1 = np.deg2rad(lat1)
+        phi2 = np.deg2rad(lat2)
+        delta_phi = np.deg2rad(lat2 - lat1)
+        delta_lambda = np.deg2rad(lon2 - lon1)
+        
+        # Haversine formula, using sin^2(x/2) = (1 - cos(x)) / 2
+        a = (0.5 * (1 - np.cos(delta_phi)) +
+             np.cos(phi1) * np.cos(phi2) * 0.5 * (1 - np.cos(delta_lambda)))
+        np.clip(a, 0.0, 1.0, out=a)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        
+        # Distance in nautical miles
+        return _EARTH_RADIUS_NM * c
 
-def get_coordinate_input(prompt_text):
+    def pairwise_courses(self, lat: ArrayLike, lon: ArrayLike,
+                         upper_only: bool = False) -> np.ndarray:
+        """
+        Calculate true courses between every pair of waypoints (vectorized)
+        
+        Args:
+            lat (np.ndarray): Latitudes of N waypoints (degrees)
+            lon (np.ndarray): Longitudes of N waypoints (degrees)
+            upper_only (bool): If True, return only the strict upper triangle
+                (i < j) as a flat array ordered like np.triu_indices(N, 1)
+            
+        Returns:
+            np.ndarray: N x N matrix where [i, j] is the true course from
+            waypoint i to waypoint j (degrees, 0-360), or the flat upper
+            triangle when upper_only is True
+        """
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        phi = np.deg2rad(lat)
+        lam = np.deg2rad(lon)
+        
+        if upper_only:
+            # Only evaluate i < j pairs to avoid building full N x N temporaries
+            i, j = np.triu_indices(lat.size, 1)
+            phi1, phi2 = phi[i], phi[j]
+            delta_lambda = lam[j] - lam[i]
+        else:
+            # Broadcast rows (FROM) against columns (TO)
+            phi1 = phi[:, None]
+            phi2 = phi[None, :]
+            delta_lambda = lam[None, :] - lam[:, None]
+        
+        y = np.sin(delta_lambda) * np.cos(phi2)
+        x = (np.cos(phi1) * np.sin(phi2) -
+             np.sin(phi1) * np.cos(phi2) * np.cos(delta_lambda))
+        
+        # Normalize to 0-360 degrees
+        return _wrap360_vec(np.rad2deg(_fast_atan2_vec(y, x)) + 360.0)
+
+    def compute_route_stats(self, lats: ArrayLike,
+                            lons: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate true course and distance for every leg of a route
+        
+        sin/cos of each waypoint latitude are computed once and shared by
+        the leg that ends there and the leg that starts there.
+        
+        Args:
+            lats (np.ndarray): Latitudes of the K route waypoints, in order (degrees)
+            lons (np.ndarray): Longitudes of the K route waypoints, in order (degrees)
+            
+        Returns:
+            tuple: (true_courses, distances) as arrays of K-1 legs,
+            in degrees (0-360) and nautical miles, unrounded
+        """
+        phi = np.deg2rad(np.asarray(lats, dtype=np.float64))
+        cos_phi = np.cos(phi)
+        sin_phi = np.sin(phi)
+        delta_lambda = np.deg2rad(np.diff(np.asarray(lons, dtype=np.float64)))
+        cdl = np.cos(delta_lambda)
+        sdl = np.sin(delta_lambda)
+        
+        # True course per leg
+        y = sdl * cos_phi[1:]
+        x = cos_phi[:-1] * sin_phi[1:] - sin_phi[:-1] * cos_phi[1:] * cdl
+        courses = _wrap360_vec(np.rad2deg(_fast_atan2_vec(y, x)) + 360.0)
+        
+        # Haversine, reusing cos_phi and cos(delta_lambda): sin^2(x/2) = (1 - cos(x)) / 2
+        a = 0.5 * (1 - np.cos(np.diff(phi))) + cos_phi[:-1] * cos_phi[1:] * 0.5 * (1 - cdl)
+        np.clip(a, 0.0, 1.0, out=a)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        distances = _EARTH_RADIUS_NM * c
+        
+        return courses, distances
+
+def get_coordinate_input(prompt_text: str) -> float:
     """
     Get coordinate input from user with validation
     
@@ -133,10 +538,16 @@ def get_coordinate_input(prompt_text):
     while True:
         try:
             coord_str = input(prompt_text).strip()
+            
+            # Cheap format check so malformed input never reaches float()
+            body = coord_str[1:] if coord_str[:1] in ('+', '-') else coord_str
+            if not body.replace('.', '', 1).isdecimal():
+                print("⚠️  Invalid format. Please enter coordinates in hh.hhhh format (e.g., 23.9739)")
+                continue
             coord_value = float(coord_str)
             
             # Basic validation for reasonable coordinate ranges
-            if abs(coord_value) > 180:
+            if not -180 <= coord_value <= 180:
                 print("⚠️  Invalid coordinate. Please enter a value between -180 and 180.")
                 continue
                 
@@ -148,54 +559,63 @@ def get_coordinate_input(prompt_text):
             print("\n\n👋 Goodbye!")
             exit(0)
 
-def main():
+def run_once(calculator: MagneticCourseCalculator) -> None:
+    """
+    Prompt for one route and print its course and distance
+    
+    Args:
+        calculator (MagneticCourseCalculator): Calculator instance to use
+    """
+    # Get starting point coordinates
+    print("\n📍 Starting Point (FROM):")
+    lat1 = get_coordinate_input("  Latitude:  ")
+    lon1 = get_coordinate_input("  Longitude: ")
+    
+    # Get destination coordinates  
+    print("\n📍 Destination Point (TO):")
+    lat2 = get_coordinate_input("  Latitude:  ")
+    lon2 = get_coordinate_input("  Longitude: ")
+    
+    # Calculate courses and distance
+    true_course, magnetic_course, distance = calculator.course_and_distance(lat1, lon1, lat2, lon2)
+    
+    # Display results
+    print("\n" + "=" * 50)
+    print("📊 CALCULATION RESULTS")
+    print("=" * 50)
+    print(f"From: {lat1:8.4f}°, {lon1:9.4f}°")
+    print(f"To:   {lat2:8.4f}°, {lon2:9.4f}°")
+    print("-" * 50)
+    print(f"Distance:        {distance:6.1f} NM")
+    print(f"True Course:     {true_course:6.1f}°")
+    print(f"Magnetic Course: {magnetic_course:6.1f}°")
+    print(f"Magnetic Var:    {calculator.MAGNETIC_VARIATION:6.1f}°")
+    print("=" * 50)
+
+def main() -> None:
     """
     Main function for interactive coordinate input and calculation
     """
     print("🧭 Magnetic Course Degree Calculator")
     print("=" * 50)
     print("Calculate magnetic course between two coordinates")
-    print(f"Magnetic Variation: {-4.1}° (regional setting)")
+    print(f"Magnetic Variation: {_MAGNETIC_VARIATION}° (regional setting)")
     print("Input format: hh.hhhh (e.g., 23.9739)")
     print("=" * 50)
     
     calculator = MagneticCourseCalculator()
     
     try:
-        # Get starting point coordinates
-        print("\n📍 Starting Point (FROM):")
-        lat1 = get_coordinate_input("  Latitude:  ")
-        lon1 = get_coordinate_input("  Longitude: ")
-        
-        # Get destination coordinates  
-        print("\n📍 Destination Point (TO):")
-        lat2 = get_coordinate_input("  Latitude:  ")
-        lon2 = get_coordinate_input("  Longitude: ")
-        
-        # Calculate courses and distance
-        true_course, magnetic_course = calculator.calculate_magnetic_course(lat1, lon1, lat2, lon2)
-        distance = calculator.calculate_distance(lat1, lon1, lat2, lon2)
-        
-        # Display results
-        print("\n" + "=" * 50)
-        print("📊 CALCULATION RESULTS")
-        print("=" * 50)
-        print(f"From: {lat1:8.4f}°, {lon1:9.4f}°")
-        print(f"To:   {lat2:8.4f}°, {lon2:9.4f}°")
-        print("-" * 50)
-        print(f"Distance:        {distance:6.1f} NM")
-        print(f"True Course:     {true_course:6.1f}°")
-        print(f"Magnetic Course: {magnetic_course:6.1f}°")
-        print(f"Magnetic Var:    {calculator.MAGNETIC_VARIATION:6.1f}°")
-        print("=" * 50)
-        
-        # Ask if user wants to calculate another route
-        print("\n📝 Calculate another route? (y/n): ", end="")
-        if input().lower().startswith('y'):
+        while True:
+            run_once(calculator)
+            
+            # Ask if user wants to calculate another route
+            print("\n📝 Calculate another route? (y/n): ", end="")
+            if not input().lower().startswith('y'):
+                break
             print("\n")
-            main()  # Recursive call for another calculation
-        else:
-            print("\n👋 Thank you for using Magnetic Course Calculator!")
+        
+        print("\n👋 Thank you for using Magnetic Course Calculator!")
             
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
@@ -0,0 +1,14 @@
+"""
+Optional ahead-of-time build of the magnetic course calculator with mypyc
+
+Usage: python setup.py build_ext --inplace
+Requires: mypy (provides mypyc) and a C compiler
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="magn_dgr_cal",
+    ext_modules=mypycify(["magn_dgr_cal.py"]),
+)
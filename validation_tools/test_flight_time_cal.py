@@ -0,0 +1,54 @@
+"""
+Regression checks for flight_time_cal
+
+Usage: python -m pytest validation_tools
+"""
+
+import math
+import warnings
+
+import numpy as np
+
+from flight_time_cal import compute
+
+
+def test_baseline_example():
+    wca_deg, ground_speed, flight_time = compute(20, 27, 266, 36.7, 120, 0)
+    assert math.isclose(wca_deg, 11.8615644, abs_tol=1e-6)
+    assert math.isclose(ground_speed, 128.4195405, abs_tol=1e-6)
+    assert flight_time == 18
+
+
+def test_direct_headwind():
+    wca_deg, ground_speed, flight_time = compute(90, 20, 90, 50, 120, 0)
+    assert math.isclose(wca_deg, 0.0, abs_tol=1e-9)
+    assert math.isclose(ground_speed, 100.0)
+    assert flight_time == 30
+
+
+def test_direct_tailwind():
+    wca_deg, ground_speed, flight_time = compute(270, 20, 90, 70, 120, 0)
+    assert math.isclose(wca_deg, 0.0, abs_tol=1e-9)
+    assert math.isclose(ground_speed, 140.0)
+    assert flight_time == 30
+
+
+def test_invalid_inputs_give_nan_without_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        # Crosswind stronger than the TAS
+        assert np.isnan(compute(0, 150, 90, 10, 120, 0)).all()
+        # Zero TAS
+        assert np.isnan(compute(20, 27, 266, 36.7, 0, 0)).all()
+
+
+def test_array_broadcast():
+    wind_dirs = np.array([20.0, 90.0, 270.0, 0.0])
+    tas = np.array([[120.0], [0.0]])
+    wca_deg, ground_speed, flight_time = compute(wind_dirs, 20, 90, 70, tas, 0)
+    assert flight_time.shape == (2, 4)
+    for k, wind_dir in enumerate(wind_dirs):
+        expected = compute(wind_dir, 20, 90, 70, 120, 0)
+        assert math.isclose(ground_speed[0, k], expected[1])
+        assert flight_time[0, k] == expected[2]
+    assert np.isnan(flight_time[1]).all()
@@ -0,0 +1,140 @@
+"""
+Regression checks for magn_dgr_cal
+
+Usage: python -m pytest validation_tools
+"""
+
+import math
+
+import numpy as np
+
+import magn_dgr_cal
+from magn_dgr_cal import MagneticCourseCalculator, _fast_atan2, _fast_atan2_vec, _wrap360_vec
+
+# Sample route around the Taiwan Strait wind farms
+ROUTE_LAT = np.array([24.5, 23.9739, 25.1, 24.0, 24.3])
+ROUTE_LON = np.array([120.5, 120.982, 121.3, 119.9, 120.1])
+
+# (lat1, lon1, lat2, lon2, true course) along the equator and prime meridian
+CARDINAL_LEGS = [
+    (0.0, 0.0, 1.0, 0.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0, 90.0),
+    (0.0, 0.0, -1.0, 0.0, 180.0),
+    (0.0, 0.0, 0.0, -1.0, 270.0),
+]
+
+
+def test_cardinal_bearings_scalar():
+    calculator = MagneticCourseCalculator()
+    for lat1, lon1, lat2, lon2, expected in CARDINAL_LEGS:
+        assert calculator.calculate_true_course(lat1, lon1, lat2, lon2) == expected
+        assert calculator.course_and_distance(lat1, lon1, lat2, lon2)[0] == expected
+
+
+def test_cardinal_bearings_vec():
+    calculator = MagneticCourseCalculator()
+    lat1, lon1, lat2, lon2, expected = (np.array(col) for col in zip(*CARDINAL_LEGS))
+    courses = calculator.calculate_true_course_vec(lat1, lon1, lat2, lon2)
+    np.testing.assert_allclose(courses, expected, atol=1e-9)
+
+
+def test_due_north_stays_below_360():
+    calculator = MagneticCourseCalculator()
+    assert calculator.calculate_magnetic_course(24, 120, 25, 120) == (0.0, 355.9)
+
+
+def test_fast_atan2_error_bound():
+    angles = np.linspace(-math.pi, math.pi, 20001)[1:-1]
+    y, x = np.sin(angles), np.cos(angles)
+    expected = np.arctan2(y, x)
+    assert np.abs(_fast_atan2_vec(y, x) - expected).max() < 1.3e-5
+    assert max(abs(_fast_atan2(a, b) - e) for a, b, e in zip(y, x, expected)) < 1.3e-5
+    assert _fast_atan2(0.0, 0.0) == 0.0
+
+
+def test_near_antipodal_distance_is_finite():
+    calculator = MagneticCourseCalculator()
+    rng = np.random.default_rng(0)
+    lat = rng.uniform(-89, 89, 2000)
+    lon = rng.uniform(-180, 180, 2000)
+    lat2 = -lat + rng.normal(0, 1e-6, lat.size)
+    lon2 = lon + 180 + rng.normal(0, 1e-6, lon.size)
+    half_circumference = math.pi * 3443.89849
+    for args in zip(lat, lon, lat2, lon2):
+        assert calculator.calculate_distance(*args) <= round(half_circumference, 1)
+    assert np.isfinite(calculator.calculate_distance_vec(lat, lon, lat2, lon2)).all()
+
+
+def test_wrap360_vec_range():
+    edges = np.nextafter(np.array([360.0, 540.0, 720.0]), 0)
+    values = np.concatenate([np.random.default_rng(1).uniform(180, 540, 100000),
+                             edges, [180.0, 360.0, 540.0]])
+    wrapped = _wrap360_vec(values.copy())
+    assert ((wrapped >= 0) & (wrapped < 360)).all()
+    np.testing.assert_allclose(wrapped, np.mod(values, 360.0), atol=1e-9)
+    assert _wrap360_vec(np.array([360.0]))[0] == 0.0
+    assert _wrap360_vec(400.0) == 40.0
+    assert _wrap360_vec(np.array(400.0)) == 40.0
+
+
+def test_vec_paths_accept_scalars():
+    calculator = MagneticCourseCalculator()
+    expected = calculator.calculate_true_course_vec(np.array([24.0]), np.array([120.0]),
+                                                    np.array([25.0]), np.array([121.0]))[0]
+    assert calculator.calculate_true_course_vec(24, 120, 25, 121) == expected
+    true_course, magnetic_course = calculator.calculate_magnetic_course_vec(24, 120, 25, 121)
+    assert true_course == expected
+    assert 0 <= magnetic_course < 360
+
+
+def test_magnetic_variation_attribute_is_used():
+    calculator = MagneticCourseCalculator()
+    calculator.MAGNETIC_VARIATION = -10.0
+    assert calculator.calculate_magnetic_course(24, 120, 25, 120) == (0.0, 350.0)
+    assert calculator.course_and_distance(24, 120, 25, 120)[1] == 350.0
+    assert calculator.calculate_magnetic_course_vec(24, 120, 25, 120)[1] == 350.0
+
+
+def test_pairwise_courses_matches_vec_and_upper_triangle():
+    calculator = MagneticCourseCalculator()
+    full = calculator.pairwise_courses(ROUTE_LAT, ROUTE_LON)
+    i, j = np.meshgrid(np.arange(ROUTE_LAT.size), np.arange(ROUTE_LAT.size), indexing='ij')
+    expected = calculator.calculate_true_course_vec(ROUTE_LAT[i], ROUTE_LON[i],
+                                                    ROUTE_LAT[j], ROUTE_LON[j])
+    np.testing.assert_allclose(full, expected, atol=1e-9)
+    upper = calculator.pairwise_courses(ROUTE_LAT, ROUTE_LON, upper_only=True)
+    np.testing.assert_allclose(upper, full[np.triu_indices(ROUTE_LAT.size, 1)], atol=1e-9)
+
+
+def test_pairwise_courses_empty_and_single():
+    calculator = MagneticCourseCalculator()
+    assert calculator.pairwise_courses(np.array([]), np.array([])).shape == (0, 0)
+    assert calculator.pairwise_courses(np.array([]), np.array([]), upper_only=True).shape == (0,)
+    assert calculator.pairwise_courses(np.array([24.0]), np.array([120.0])).tolist() == [[0.0]]
+    assert calculator.pairwise_courses(np.array([24.0]), np.array([120.0]), upper_only=True).shape == (0,)
+
+
+def test_route_stats_match_sliced_vec_paths():
+    calculator = MagneticCourseCalculator()
+    courses, distances = calculator.compute_route_stats(ROUTE_LAT, ROUTE_LON)
+    legs = (ROUTE_LAT[:-1], ROUTE_LON[:-1], ROUTE_LAT[1:], ROUTE_LON[1:])
+    np.testing.assert_allclose(courses, calculator.calculate_true_course_vec(*legs), atol=1e-9)
+    np.testing.assert_allclose(distances, calculator.calculate_distance_vec(*legs), atol=1e-9)
+
+
+def test_route_stats_empty_and_single():
+    calculator = MagneticCourseCalculator()
+    for size in (0, 1):
+        courses, distances = calculator.compute_route_stats(ROUTE_LAT[:size], ROUTE_LON[:size])
+        assert courses.shape == (0,)
+        assert distances.shape == (0,)
+
+
+def test_gpu_falls_back_to_vec_without_cupy(monkeypatch):
+    monkeypatch.setattr(magn_dgr_cal, '_HAS_CUPY', False)
+    calculator = MagneticCourseCalculator()
+    legs = (ROUTE_LAT[:-1], ROUTE_LON[:-1], ROUTE_LAT[1:], ROUTE_LON[1:])
+    np.testing.assert_array_equal(calculator.calculate_true_course_gpu(*legs),
+                                  calculator.calculate_true_course_vec(*legs))
+    assert (calculator.calculate_true_course_gpu(24, 120, 25, 121) ==
+            calculator.calculate_true_course_vec(24, 120, 25, 121))